@@ -4,6 +4,7 @@ from app.base import POSE_ESTIMATION_MODEL_NAME, App
 from processors.angles_processor import AnglesProcessor
 from processors.joints_processor import JointsProcessor
 from utils.repetitions_counter import RepetitionsCounter
+from utils.video_stream import PoseStream, VideoStream
 from utils.visualizer import Visualizer
 
 
@@ -36,46 +37,45 @@ class LiveAnalysisApp(App):
             self.logger.critical("❌ Error on opening video stream or file! ❌")
             return
 
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            results = self._pose_estimation_model.process(frame)
-            landmarks = results.pose_landmarks
-            world_landmards = results.pose_world_landmarks
-
-            if world_landmards:
-                # Joints processing
-                frame_number = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
-                JointsProcessor.current_processing_frame = frame_number
-
-                joints = joints_processor.process(world_landmards)
-                joints_processor.update(joints)
-
-                # Angle processing
-                angles = angles_processor.process(joints)
-                angles_processor.update(angles)
-
-                # Exercise state
-                progress = repetitions_counter.process(angles)
-                repetitions_counter.update(progress)
-
-                # Updating window
-                visualizer.update_figure(
-                    joints,
-                    angles,
-                    progress,
-                    repetitions_counter.repetitions_count,
-                    repetitions_counter.state,
-                )
-                visualizer.draw_landmarks(
-                    frame, landmarks, self._mp_pose.POSE_CONNECTIONS
-                )
-
-            cv2.imshow("Mediapipe", frame)
-            if cv2.waitKey(1) & 0xFF == ord("q"):
-                break
+        live = isinstance(input_source, int)
+        with (
+            VideoStream(cap, live=live) as frames,
+            PoseStream(frames, self._pose_estimation_model, live=live) as poses,
+        ):
+            for frame_number, frame, results in poses:
+                landmarks = results.pose_landmarks
+                world_landmards = results.pose_world_landmarks
+
+                if world_landmards:
+                    # Joints processing
+                    JointsProcessor.current_processing_frame = frame_number
+
+                    joints = joints_processor.process(world_landmards)
+                    joints_processor.update(joints)
+
+                    # Angle processing
+                    angles = angles_processor.process(joints)
+                    angles_processor.update(angles)
+
+                    # Exercise state
+                    progress = repetitions_counter.process(angles)
+                    repetitions_counter.update(progress)
+
+                    # Updating window
+                    visualizer.update_figure(
+                        joints,
+                        angles,
+                        progress,
+                        repetitions_counter.repetitions_count,
+                        repetitions_counter.state,
+                    )
+                    visualizer.draw_landmarks(
+                        frame, landmarks, self._mp_pose.POSE_CONNECTIONS
+                    )
+
+                cv2.imshow("Mediapipe", frame)
+                if cv2.waitKey(1) & 0xFF == ord("q"):
+                    break
 
         cap.release()
         cv2.destroyAllWindows()
@@ -1,4 +1,5 @@
 import os
+import pickle
 
 import cv2
 import pandas as pd
@@ -6,13 +7,19 @@ import pandas as pd
 from app.base import POSE_ESTIMATION_MODEL_NAME, App
 from models.angle import Angle
 from models.joint import Joint
+from models.segment import Segment
 from processors.angles_processor import AnglesProcessor
 from processors.joints_processor import JointsProcessor
 from processors.mistakes_processor import MistakesProcessor
 from processors.results_processor import ResultsProcessor
 from processors.segments_processor import SegmentsProcessor
+from utils.video_stream import PoseStream, VideoStream
 
 PATH_TO_REFERENCE = "data/{exercise}/features/reference"
+REFERENCE_CACHE_FILE = "reference_segment.pkl"
+# Bump whenever the pickled layout of Segment, Joint or Angle changes
+# (2: slotted frozen Angle, Joint and Mistake)
+REFERENCE_CACHE_VERSION = 2
 
 
 class VideoAnalysisApp(App):
@@ -32,12 +39,7 @@ class VideoAnalysisApp(App):
         self.joint_names = model_config_data["joints"]
         self.connections = model_config_data["connections"]["torso"]
 
-        path_to_reference = os.path.join(PATH_TO_REFERENCE.format(exercise=exercise))
-        reference_joints = pd.read_csv(os.path.join(path_to_reference, "joints.csv"))
-        reference_angles = pd.read_csv(os.path.join(path_to_reference, "angles.csv"))
-        self.reference_segment = SegmentsProcessor.from_df(
-            (reference_joints, reference_angles)
-        )
+        self.reference_segment = self.__load_reference_segment(exercise)
 
     def run(self, input_source: str, output: str, save_results: bool) -> None:
         cap = cv2.VideoCapture(input_source)
@@ -98,26 +100,75 @@ class VideoAnalysisApp(App):
         angles_processor = AnglesProcessor(self.angle_names)
 
         self.logger.info("Starting features extraction from video... 🎬")
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
+        with (
+            VideoStream(cap) as frames,
+            PoseStream(frames, self._pose_estimation_model) as poses,
+        ):
+            for frame_number, frame, results in poses:
+                world_landmards = results.pose_world_landmarks
+
+                if world_landmards:
+                    JointsProcessor.current_processing_frame = frame_number
+
+                    joints = joints_processor.process(world_landmards)
+                    joints_processor.update(joints)
+        cap.release()
 
-            results = self._pose_estimation_model.process(frame)
-            world_landmards = results.pose_world_landmarks
+        # Angles of all frames are calculated at once after capture
+        angles = []
+        if len(joints_processor) > 0:
+            frame_numbers, coords = joints_processor.frame_coords()
+            angles = angles_processor.process_coords(frame_numbers, coords)
 
-            if world_landmards:
-                frame_number = int(cap.get(cv2.CAP_PROP_POS_FRAMES))
-                JointsProcessor.current_processing_frame = frame_number
+        return joints_processor.data, angles
 
-                joints = joints_processor.process(world_landmards)
-                joints_processor.update(joints)
+    def __load_reference_segment(self, exercise: str) -> Segment:
+        path_to_reference = PATH_TO_REFERENCE.format(exercise=exercise)
+        joints_path = os.path.join(path_to_reference, "joints.csv")
+        angles_path = os.path.join(path_to_reference, "angles.csv")
+        cache_path = os.path.join(path_to_reference, REFERENCE_CACHE_FILE)
 
-                angles = angles_processor.process(joints)
-                angles_processor.update(angles)
-        cap.release()
+        # Parsed reference is cached next to the CSVs until they change
+        sources_mtime = max(
+            os.path.getmtime(joints_path), os.path.getmtime(angles_path)
+        )
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) > sources_mtime:
+            reference_segment = self.__read_reference_cache(cache_path)
+            if reference_segment is not None:
+                return reference_segment
+
+        reference_joints = pd.read_csv(joints_path, engine="pyarrow")
+        reference_angles = pd.read_csv(angles_path, engine="pyarrow")
+        reference_segment = SegmentsProcessor.from_df(
+            (reference_joints, reference_angles)
+        )
 
-        return joints_processor.data, angles_processor.data
+        try:
+            with open(cache_path, "wb") as file:
+                pickle.dump(
+                    (REFERENCE_CACHE_VERSION, reference_segment),
+                    file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
+                )
+        except OSError as error:
+            self.logger.warning("Could not cache reference segment: %s", error)
+        return reference_segment
+
+    def __read_reference_cache(self, cache_path: str) -> Segment | None:
+        try:
+            with open(cache_path, "rb") as file:
+                version, reference_segment = pickle.load(file)
+        except Exception as error:
+            # Cache is optional, anything unreadable is rebuilt from the CSVs
+            self.logger.warning("Rebuilding reference cache: %s", error)
+            return None
+
+        if version != REFERENCE_CACHE_VERSION or not isinstance(
+            reference_segment, Segment
+        ):
+            self.logger.warning("Rebuilding outdated reference cache")
+            return None
+        return reference_segment
 
     def save_results(
         self,
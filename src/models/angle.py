@@ -4,7 +4,7 @@ ANGLE_PARAMETERS_NUM = 3
 ANGLES_PER_FRAME = 8
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Angle:
     """
     Angle calculated from joint positions
@@ -4,7 +4,7 @@ JOINT_PARAMETERS_NUM = 7
 JOINTS_PER_FRAME = 16
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Joint:
     """
     Joint extracted by DNN model from video
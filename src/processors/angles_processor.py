@@ -6,9 +6,11 @@ import pandas as pd
 from models.angle import ANGLE_PARAMETERS_NUM, Angle
 from models.joint import Joint
 from processors.base import Processor
+from utils.column_buffer import ColumnBuffer
 
 # For mediapipe Y is switched with Z
 MEDIAPIPE_ANGLE_TYPES = {"3D": [0, 1, 2], "top": [0, 2], "side": [0, 1], "front": [1, 2]}
+ANGLE_COLUMNS = {"frame": np.int32, "name": np.int16, "value": np.float64}
 
 
 class AnglesProcessor(Processor):
@@ -16,24 +18,66 @@ class AnglesProcessor(Processor):
         super().__init__()
         self.angle_names = angle_names
 
+        self._tri_idx = np.array(list(angle_names.values()), dtype=np.intp)
+        self._names = [
+            f"{angle_name}_{angle_type}"
+            for angle_name in angle_names
+            for angle_type in MEDIAPIPE_ANGLE_TYPES
+        ]
+        self._dims_mask = np.zeros((len(MEDIAPIPE_ANGLE_TYPES), 3))
+        for type_idx, angle_dims in enumerate(MEDIAPIPE_ANGLE_TYPES.values()):
+            self._dims_mask[type_idx, angle_dims] = 1.0
+        self._name_idx = {name: idx for idx, name in enumerate(self._names)}
+
+        # Joint coordinates indexed directly by joint id, reused between calls
+        self._joints_num = int(self._tri_idx.max()) + 1
+        self._coords = np.empty((1, self._joints_num, 3))
+
     def __len__(self) -> int:
-        return len(self.data) * ANGLE_PARAMETERS_NUM
+        return len(self._buffer) * ANGLE_PARAMETERS_NUM
+
+    @property
+    def data(self) -> list[Angle]:
+        frames = self._buffer.column("frame").tolist()
+        names = self._buffer.column("name").tolist()
+        values = self._buffer.column("value").tolist()
+        return [
+            Angle(frame, self._names[name], value)
+            for frame, name, value in zip(frames, names, values)
+        ]
+
+    @data.setter
+    def data(self, data: list[Angle]) -> None:
+        self._buffer = ColumnBuffer(**ANGLE_COLUMNS)
+        if data:
+            self.update(data)
 
     def process(self, data: list[Joint]) -> list[Angle]:
-        frame_number = data[0].frame
-        joint_dict = {joint.id: [joint.x, joint.y, joint.z] for joint in data}
-
-        angles = []
-        for angle_name, joint_ids in self.angle_names.items():
-            coords = np.array([joint_dict[joint_id] for joint_id in joint_ids])
-            for angle_type, angle_dims in MEDIAPIPE_ANGLE_TYPES.items():
-                angle = self.__calculate_angle(*coords, angle_dims)
-                angles.append(Angle(frame_number, f"{angle_name}_{angle_type}", angle))
-
-        return angles
+        self._coords.fill(np.nan)
+        for joint in data:
+            if joint.id < self._joints_num:
+                self._coords[0, joint.id] = joint.x, joint.y, joint.z
+
+        return self.process_coords([data[0].frame], self._coords)
+
+    def process_coords(self, frames: list[int], coords: np.ndarray) -> list[Angle]:
+        """
+        Calculate angles from joint coordinates of shape (frames, joints, 3)
+        indexed by joint id, in one vectorized pass over all frames
+        """
+        values = self.__calculate_angles(coords).reshape(len(frames), -1).tolist()
+        return [
+            Angle(frame, name, value)
+            for frame, frame_values in zip(frames, values)
+            for name, value in zip(self._names, frame_values)
+        ]
 
     def update(self, data: list[Angle]) -> None:
-        self.data.extend(data)
+        self._buffer.append(
+            frame=[angle.frame for angle in data],
+            name=[self._name_idx[angle.name] for angle in data],
+            value=[angle.value for angle in data],
+        )
 
     @staticmethod
     def to_df(data: list[Angle]) -> pd.DataFrame:
@@ -50,32 +94,52 @@ class AnglesProcessor(Processor):
             var_name="angle_name",
             value_name="value",
         )
-        angles = []
-        for _, angle in df_melted.iterrows():
-            angles.append(Angle(angle["frame"], angle["angle_name"], angle["value"]))
-        return angles
+        rows = df_melted[["frame", "angle_name", "value"]].itertuples(
+            index=False, name=None
+        )
+        return [Angle(frame, name, value) for frame, name, value in rows]
 
     def save(self, output_dir: str) -> None:
         output = self._validate_output(output_dir)
-        angles_df = self.to_df(self.data)
+        angles_df = self.__columns_to_df()
 
         results_path = os.path.join(output, "angles.csv")
         angles_df.to_csv(results_path, index=True)
 
-    @staticmethod
-    def __calculate_angle(
-        v1: np.ndarray, v2: np.ndarray, v3: np.ndarray, dims: list
-    ) -> float:
-        if not all(arr.shape == (3,) for arr in (v1, v2, v3)):
-            raise ValueError("Input arrays must all be of shape (3,).")
-        v1 = v1[dims]
-        v2 = v2[dims]
-        v3 = v3[dims]
-
-        v21 = v1 - v2
-        v23 = v3 - v2
-
-        cosine_angle = np.dot(v21, v23) / (np.linalg.norm(v21) * np.linalg.norm(v23))
-        angle = np.arccos(cosine_angle)
-
-        return np.degrees(angle)
+    def __columns_to_df(self) -> pd.DataFrame:
+        df = pd.DataFrame(
+            {
+                "frame": self._buffer.column("frame"),
+                "name": pd.Categorical.from_codes(
+                    self._buffer.column("name"), self._names
+                ),
+                "value": self._buffer.column("value"),
+            }
+        )
+        return df.pivot(index="frame", columns="name", values="value")
+
+    def __calculate_angles(self, coords: np.ndarray) -> np.ndarray:
+        """
+        Calculate every configured angle for each angle type at once.
+        Takes coords of shape (..., joints, 3) indexed by joint id and
+        returns array of shape (..., angles, angle types) in degrees.
+        """
+        triplets = coords[..., self._tri_idx, :]
+        ba = triplets[..., 0, :] - triplets[..., 1, :]
+        bc = triplets[..., 2, :] - triplets[..., 1, :]
+
+        # Projection on the angle type plane is done by masking unused dims.
+        # Dot product and both squared norms are reduced in one matmul.
+        products = np.empty((3, *ba.shape))
+        np.multiply(ba, bc, out=products[0])
+        np.multiply(ba, ba, out=products[1])
+        np.multiply(bc, bc, out=products[2])
+        dot, ba_norm_sq, bc_norm_sq = products @ self._dims_mask.T
+
+        # Remaining steps are done in place to avoid temporary arrays
+        norms = np.multiply(ba_norm_sq, bc_norm_sq, out=ba_norm_sq)
+        np.sqrt(norms, out=norms)
+        cosine_angle = np.divide(dot, norms, out=dot)
+        np.clip(cosine_angle, -1.0, 1.0, out=cosine_angle)
+        angles = np.arccos(cosine_angle, out=cosine_angle)
+        return np.degrees(angles, out=angles)
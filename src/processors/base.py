@@ -15,6 +15,9 @@ class Processor(ABC):
         self.data = []
         self.current_time = datetime.datetime.now()
 
+    def __len__(self) -> int:
+        return len(self.data)
+
     @abstractmethod
     def process(self, data: list[Any]) -> list[Any]:
         """
@@ -52,7 +55,7 @@ class Processor(ABC):
             self.current_time, "%Y-%m-%d_%H:%M:%S"
         )
 
-        if not self.data:
+        if len(self) == 0:
             raise ValueError("No data to save.")
 
         output_dir = os.path.join(output_dir, output_subdir)
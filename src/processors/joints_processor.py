@@ -1,10 +1,19 @@
 import os
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from models.joint import JOINT_PARAMETERS_NUM, Joint
 from processors.base import Processor
+from utils.column_buffer import ColumnBuffer
+
+JOINT_COLUMNS = {
+    "frame": np.int32,
+    "id": np.int16,
+    "xyz": (np.float32, 3),
+    "visibility": np.float32,
+}
 
 
 class JointsProcessor(Processor):
@@ -19,7 +28,26 @@ class JointsProcessor(Processor):
         self.joint_names = joint_names
 
     def __len__(self) -> int:
-        return len(self.data) * JOINT_PARAMETERS_NUM
+        return len(self._buffer) * JOINT_PARAMETERS_NUM
+
+    @property
+    def data(self) -> list[Joint]:
+        frames = self._buffer.column("frame").tolist()
+        ids = self._buffer.column("id").tolist()
+        xyz = self._buffer.column("xyz").tolist()
+        visibility = self._buffer.column("visibility").tolist()
+        return [
+            Joint(frame, idx, self.joint_names[idx], x, y, z, joint_visibility)
+            for frame, idx, (x, y, z), joint_visibility in zip(
+                frames, ids, xyz, visibility
+            )
+        ]
+
+    @data.setter
+    def data(self, data: list[Joint]) -> None:
+        self._buffer = ColumnBuffer(**JOINT_COLUMNS)
+        if data:
+            self.update(data)
 
     def process(self, data: Any) -> list[Joint]:
         return [
@@ -37,7 +65,22 @@ class JointsProcessor(Processor):
         ]
 
     def update(self, data: list[Joint]) -> None:
-        self.data.extend(data)
+        self._buffer.append(
+            frame=[joint.frame for joint in data],
+            id=[joint.id for joint in data],
+            xyz=[[joint.x, joint.y, joint.z] for joint in data],
+            visibility=[joint.visibility for joint in data],
+        )
+
+    def frame_coords(self) -> tuple[list[int], np.ndarray]:
+        """
+        Get stored frame numbers and joint coordinates of shape (frames, joints, 3)
+        indexed by joint id
+        """
+        frames, rows = np.unique(self._buffer.column("frame"), return_inverse=True)
+        coords = np.full((len(frames), max(self.joint_names) + 1, 3), np.nan)
+        coords[rows, self._buffer.column("id")] = self._buffer.column("xyz")
+        return frames.tolist(), coords
 
     @staticmethod
     def to_df(data: list[list[Joint]]) -> pd.DataFrame:
@@ -65,7 +108,23 @@ class JointsProcessor(Processor):
     def save(self, output_dir: str) -> None:
         output = self._validate_output(output_dir)
 
-        joints_df = self.to_df(self.data)
+        joints_df = self.__columns_to_df()
 
         results_path = os.path.join(output, "joints.csv")
         joints_df.to_csv(results_path, index=False)
+
+    def __columns_to_df(self) -> pd.DataFrame:
+        ids = self._buffer.column("id")
+        xyz = self._buffer.column("xyz")
+        df = pd.DataFrame(
+            {
+                "frame": self._buffer.column("frame"),
+                "id": ids,
+                "name": pd.Series(ids).map(self.joint_names),
+                "x": xyz[:, 0],
+                "y": xyz[:, 1],
+                "z": xyz[:, 2],
+                "visibility": self._buffer.column("visibility"),
+            }
+        )
+        return df.set_index("frame")
@@ -1,7 +1,9 @@
 import os
+from collections import defaultdict
 
 import pandas as pd
 
+from models.angle import Angle
 from models.mistake import Mistake
 from models.result import Result
 from models.segment import Segment
@@ -22,21 +24,16 @@ class ResultsProcessor(Processor):
         super().__init__()
         self.reference_segment = reference_segement
         self.comparison_features = compariston_features
+        self._reference_values = self.__group_by_name(reference_segement.angles)
 
-    def process(self, data: Segment) -> Result:
-        query = data
+    def process(self, data: Segment) -> list[Result]:
+        query_values = self.__group_by_name(data.angles)
         results = []
         for feature in self.comparison_features:
             for angle_type in MEDIAPIPE_ANGLE_TYPES.keys():
                 angle_name = feature + "_" + angle_type
-                query = [
-                    angle.value for angle in data.angles if angle.name == angle_name
-                ]
-                reference = [
-                    angle.value
-                    for angle in self.reference_segment.angles
-                    if angle.name == angle_name
-                ]
+                query = query_values[angle_name]
+                reference = self._reference_values[angle_name]
                 path = get_warped_frame_indexes(query, reference)
                 query_to_reference_warping = filter_repetable_reference_indexes(
                     path[:, 1], path[:, 0]
@@ -78,3 +75,10 @@ class ResultsProcessor(Processor):
             os.makedirs(results_path, exist_ok=True)
             results_df = self.to_df(segment_results)
             results_df.to_csv(os.path.join(results_path, "angles_diffs.csv"))
+
+    @staticmethod
+    def __group_by_name(angles: list[Angle]) -> defaultdict[str, list[float]]:
+        values = defaultdict(list)
+        for angle in angles:
+            values[angle.name].append(angle.value)
+        return values
@@ -0,0 +1,66 @@
+import numpy as np
+
+CHUNK_SIZE = 4096
+
+
+class ColumnBuffer:
+    """
+    Growable struct-of-arrays storage. Rows are written into preallocated
+    chunks of numpy arrays, one array per column.
+    """
+
+    def __init__(self, chunk_size: int = CHUNK_SIZE, **dtypes: np.dtype) -> None:
+        self._dtypes = {name: np.dtype(dtype) for name, dtype in dtypes.items()}
+        self._chunk_size = chunk_size
+        self._chunks = []
+        self._chunk_fill = 0
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, **columns: np.ndarray) -> None:
+        if columns.keys() != self._dtypes.keys():
+            raise ValueError(f"Expected columns: {', '.join(self._dtypes)}.")
+
+        columns = {
+            name: np.asarray(values, dtype=self._dtypes[name].base)
+            for name, values in columns.items()
+        }
+        rows = {len(values) for values in columns.values()}
+        if len(rows) != 1:
+            raise ValueError("All columns must have the same length.")
+        rows = rows.pop()
+
+        written = 0
+        while written < rows:
+            if not self._chunks or self._chunk_fill == self._chunk_size:
+                self.__add_chunk()
+            count = min(rows - written, self._chunk_size - self._chunk_fill)
+            chunk = self._chunks[-1]
+            for name, values in columns.items():
+                chunk[name][self._chunk_fill : self._chunk_fill + count] = values[
+                    written : written + count
+                ]
+            self._chunk_fill += count
+            written += count
+        self._length += rows
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Get contiguous copy of the whole column
+        """
+        if not self._chunks:
+            return np.empty(0, dtype=self._dtypes[name])
+        blocks = [chunk[name] for chunk in self._chunks[:-1]]
+        blocks.append(self._chunks[-1][name][: self._chunk_fill])
+        return np.concatenate(blocks)
+
+    def __add_chunk(self) -> None:
+        self._chunks.append(
+            {
+                name: np.empty(self._chunk_size, dtype=dtype)
+                for name, dtype in self._dtypes.items()
+            }
+        )
+        self._chunk_fill = 0
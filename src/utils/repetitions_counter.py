@@ -1,38 +1,73 @@
+import math
+
 import numpy as np
 
 from models.angle import Angle
 
+STATES = ("up", "down")
+UP_STATE, DOWN_STATE = 0, 1
+
 
 class RepetitionsCounter:
     """
     Counter of repetitions in live app
     """
 
-    def __init__(self, exercise_phases: str) -> None:
+    def __init__(self, exercise_phases: dict) -> None:
         self.start_angles = exercise_phases["start"]
         self.finish_angles = exercise_phases["finish"]
+        self.__validate_phases(self.start_angles, self.finish_angles)
 
         self.repetitions_count = 0
-        self.state = "up"
+        self._state = UP_STATE
 
-    def process(self, data: list[Angle]) -> list:
-        reference_angle_names = list(self.start_angles.keys())
-        start_reference_angles = np.array(list(self.start_angles.values()))
-        finish_reference_angles = np.array(list(self.finish_angles.values()))
+        self._angle_names = tuple(self.start_angles.keys())
+        self._start = np.fromiter(self.start_angles.values(), dtype=np.float64)
+        self._finish = np.fromiter(
+            (self.finish_angles[angle_name] for angle_name in self._angle_names),
+            dtype=np.float64,
+        )
+        self._ref_progress = float(self._start[0] - self._finish[0])
 
-        data_angles = np.array(
-            [angle.value for angle in data if angle.name in reference_angle_names]
+    def process(self, data: list[Angle]) -> float:
+        angle_values = {angle.name: angle.value for angle in data}
+        data_angles = np.fromiter(
+            (angle_values[angle_name] for angle_name in self._angle_names),
+            dtype=np.float64,
+            count=len(self._angle_names),
         )
 
-        reference_progress = start_reference_angles[0] - finish_reference_angles[0]
+        progress = float((self._start - data_angles).mean()) / self._ref_progress
+        if math.isnan(progress):
+            return progress
+        return min(1.0, max(0.0, progress))
+
+    @property
+    def state(self) -> str:
+        return STATES[self._state]
+
+    def update(self, progress: float) -> None:
+        trigger_down = (progress >= 1.0) & (self._state == UP_STATE)
+        trigger_up = (progress <= 0.0) & (self._state == DOWN_STATE)
 
-        progress = np.mean(start_reference_angles - data_angles)
-        progress_normalized = progress / reference_progress
-        return np.clip(progress_normalized, 0, 1)
+        self.repetitions_count += trigger_up
+        self._state ^= trigger_down | trigger_up
 
-    def update(self, progress) -> None:
-        if progress >= 1.0 and self.state == "up":
-            self.state = "down"
-        elif progress <= 0.0 and self.state == "down":
-            self.repetitions_count += 1
-            self.state = "up"
+    @staticmethod
+    def __validate_phases(start_angles: dict, finish_angles: dict) -> None:
+        if not start_angles or start_angles.keys() != finish_angles.keys():
+            raise ValueError(
+                "Start and finish phases must define the same, non-empty set of angles."
+            )
+        for phase in (start_angles, finish_angles):
+            for angle_name, value in phase.items():
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    raise ValueError(
+                        f"Invalid reference value for {angle_name}: {value!r}"
+                    )
+        first_angle = next(iter(start_angles))
+        if start_angles[first_angle] == finish_angles[first_angle]:
+            raise ValueError(
+                f"Start and finish values of {first_angle} must differ "
+                "to measure progress."
+            )
@@ -0,0 +1,122 @@
+import threading
+from abc import ABC, abstractmethod
+from queue import Empty, Full, Queue
+from typing import Any, Iterable, Iterator
+
+import cv2
+import numpy as np
+
+PREFETCH_SIZE = 16
+LIVE_PREFETCH_SIZE = 2
+POSE_PREFETCH_SIZE = 2
+LIVE_POSE_PREFETCH_SIZE = 1
+QUEUE_TIMEOUT = 0.1
+
+
+class ThreadedStream(ABC):
+    """
+    Iterable which items are produced on a background thread.
+    With drop_oldest the oldest queued item is discarded instead of blocking.
+    """
+
+    def __init__(self, prefetch: int, drop_oldest: bool = False) -> None:
+        self._items = Queue(maxsize=prefetch)
+        self._drop_oldest = drop_oldest
+        self._stopped = threading.Event()
+        self._error = None
+        self._thread = threading.Thread(target=self.__run, daemon=True)
+
+    def __enter__(self) -> "ThreadedStream":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.stop()
+
+    def __iter__(self) -> Iterator[Any]:
+        while (item := self._items.get()) is not None:
+            yield item
+        if self._error is not None:
+            raise self._error
+
+    def stop(self) -> None:
+        """
+        Stop producing and wait for the background thread
+        """
+        self._stopped.set()
+        self._thread.join()
+
+    @abstractmethod
+    def _produce(self) -> Iterator[Any]:
+        """
+        Generate items on the background thread
+        """
+
+    def __run(self) -> None:
+        try:
+            for item in self._produce():
+                if not self.__put(item):
+                    break
+        except Exception as error:
+            self._error = error
+        finally:
+            self.__put(None)
+
+    def __put(self, item: Any) -> bool:
+        while not self._stopped.is_set():
+            try:
+                if self._drop_oldest and self._items.full():
+                    self._items.get_nowait()
+                self._items.put(item, timeout=QUEUE_TIMEOUT)
+                return True
+            except (Empty, Full):
+                continue
+        return False
+
+
+class VideoStream(ThreadedStream):
+    """
+    Video capture that decodes frames on a background thread.
+    Live streams keep only the newest frames so processing never lags behind.
+    """
+
+    def __init__(self, cap: cv2.VideoCapture, live: bool = False) -> None:
+        if live:
+            super().__init__(LIVE_PREFETCH_SIZE, drop_oldest=True)
+        else:
+            super().__init__(PREFETCH_SIZE)
+        self._cap = cap
+
+    def _produce(self) -> Iterator[tuple[int, np.ndarray]]:
+        frame_number = 0
+        while self._cap.isOpened():
+            ret, frame = self._cap.read()
+            if not ret:
+                break
+            frame_number += 1
+            yield frame_number, frame
+
+
+class PoseStream(ThreadedStream):
+    """
+    Pose estimation that runs on a background thread, one frame ahead of the consumer.
+    Model is only ever called from this thread.
+    Live streams keep only the newest result, like VideoStream.
+    """
+
+    def __init__(
+        self,
+        frames: Iterable[tuple[int, np.ndarray]],
+        pose_estimation_model: Any,
+        live: bool = False,
+    ) -> None:
+        if live:
+            super().__init__(LIVE_POSE_PREFETCH_SIZE, drop_oldest=True)
+        else:
+            super().__init__(POSE_PREFETCH_SIZE)
+        self._frames = frames
+        self._pose_estimation_model = pose_estimation_model
+
+    def _produce(self) -> Iterator[tuple[int, np.ndarray, Any]]:
+        for frame_number, frame in self._frames:
+            yield frame_number, frame, self._pose_estimation_model.process(frame)